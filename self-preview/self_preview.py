@@ -23,8 +23,12 @@ Dependencies: Pillow (pip install Pillow)
 """
 
 import argparse
+import concurrent.futures
+import functools
+import io
 import math
 import os
+import pickle
 import sys
 from abc import ABC, abstractmethod
 
@@ -34,6 +38,11 @@ except ImportError:
     print("Error: Pillow is required. Install with: pip install Pillow")
     sys.exit(1)
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # optional — draw_grid falls back to per-line drawing
+
 
 # ---------------------------------------------------------------------------
 # Configuration — adjust these for your project
@@ -45,6 +54,7 @@ OVERVIEW_FILENAME = "overview.png"
 
 # Visual defaults
 DEFAULT_SIZE = 400         # pixels per item
+PNG_COMPRESS_LEVEL = 1     # zlib level for PNG output; 1 = fast encode, 9 = small files
 BG_COLOR = (26, 26, 46)   # dark background (#1a1a2e)
 FG_COLOR = (224, 224, 255) # light foreground (#e0e0ff)
 LABEL_COLOR = (180, 180, 200)
@@ -63,6 +73,72 @@ OVERLAY_COLORS = {
     "accent":    (180, 100, 255, 100),  # purple
 }
 
+# Path-separator characters stripped from item names when building filenames
+_FILENAME_SAFE = str.maketrans({"/": "_", "\\": "_"})
+
+
+# ---------------------------------------------------------------------------
+# Resampling helpers
+# ---------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=8)
+def _resample_weights(src, dst):
+    """Row weights for a separable triangle (bilinear) resample.
+
+    Computed once per (src, dst) pair and cached, so when render_overview
+    has to resize many cells of the same source size the kernel evaluation
+    happens once instead of per item. Returns a (dst, src) float32 matrix;
+    at thumbnail sizes the dense form is tiny and the per-item work becomes
+    two matrix multiplies.
+    """
+    support = max(src / dst, 1.0)
+    weights = np.zeros((dst, src), dtype=np.float32)
+    for i in range(dst):
+        center = (i + 0.5) * src / dst
+        lo = max(int(center - support), 0)
+        hi = min(int(center + support) + 1, src)
+        taps = np.clip(1.0 - np.abs(np.arange(lo, hi) + 0.5 - center) / support,
+                       0.0, None)
+        weights[i, lo:hi] = taps / taps.sum()
+    return weights
+
+
+def _resize_cell(img, size):
+    """Resize an overview cell to (size, size).
+
+    Uses the cached separable weights when NumPy is available; falls back
+    to Pillow's bilinear filter otherwise.
+    """
+    if np is None:
+        return img.resize((size, size), Image.BILINEAR)
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    arr = np.asarray(img, dtype=np.float32)
+    wy = _resample_weights(arr.shape[0], size)
+    wx = _resample_weights(arr.shape[1], size)
+    # Two separable passes: rows first, then columns
+    out = np.tensordot(wy, arr, axes=(1, 0))
+    out = np.tensordot(out, wx, axes=(1, 1)).transpose(0, 2, 1)
+    return Image.fromarray(np.clip(out, 0, 255).astype(np.uint8))
+
+
+def _encode_png(img, png_level):
+    """Encode an image to PNG bytes in memory."""
+    buf = io.BytesIO()
+    img.save(buf, format="PNG", compress_level=png_level, optimize=False)
+    return buf.getvalue()
+
+
+def _save_png(img, path, png_level):
+    """Encode to memory, then write the file in a single unbuffered call.
+
+    Skips Pillow's open/close-per-save file-path codepath and keeps the
+    encode step separate from I/O.
+    """
+    data = _encode_png(img, png_level)
+    with open(path, "wb", buffering=0) as f:
+        f.write(data)
+
 
 # ---------------------------------------------------------------------------
 # Base class — subclass this for your project
@@ -75,11 +151,46 @@ class PreviewRenderer(ABC):
     - load_artifact()  — load your build output (font file, HTML, SVG, etc.)
     - render_item()    — render one item to a Pillow Image
     - get_items()      — return list of all renderable item names
+
+    render_item() is called in a loop for every item, so keep per-item
+    lookups O(1) — e.g. map item names to data with a dict built once
+    rather than scanning a list on each call.
     """
 
+    # Slots keep base instances dict-free; subclasses without __slots__
+    # still get a __dict__ for whatever load_artifact() stores on self.
+    __slots__ = ("output_dir", "artifact", "_font", "_cache")
+
     def __init__(self, output_dir=OUTPUT_DIR):
         self.output_dir = output_dir
         self.artifact = None
+        # Set to a dict by run() when the overview follows render_items,
+        # so overview cells can downscale just-rendered images instead of
+        # re-rendering them.
+        self._cache = None
+        # Loaded once — Pillow otherwise calls ImageFont.load_default()
+        # internally on every draw.text() without an explicit font.
+        self._font = ImageFont.load_default()
+
+    def __getstate__(self):
+        # The cached default font is loaded from an in-memory buffer and
+        # doesn't survive a pickle round-trip; drop it here and reload it
+        # on the other side (parallel render workers receive the renderer
+        # via pickle). Walk __slots__ across the whole MRO so subclasses
+        # that declare their own slots pickle completely too.
+        state = {}
+        for klass in type(self).__mro__:
+            for name in getattr(klass, "__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        state.update(getattr(self, "__dict__", {}))
+        state["_font"] = None
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._font = ImageFont.load_default()
 
     @abstractmethod
     def load_artifact(self):
@@ -91,16 +202,26 @@ class PreviewRenderer(ABC):
         pass
 
     @abstractmethod
-    def render_item(self, item_name, size, overlays=True):
+    def render_item(self, item_name, size, overlays=True, target=None,
+                    offset=(0, 0)):
         """Render a single item to a Pillow Image.
 
         Args:
             item_name: identifier for the item (e.g., "A", "button", "page-1")
             size: target image size in pixels (square)
-            overlays: whether to draw reference markers
+            overlays: whether to draw reference markers. When False,
+                implementations must skip ALL overlay-related work (color
+                lookups, geometry) — this path runs for every overview
+                grid cell and is expected to stay cheap.
+            target: optional existing Image to draw onto instead of
+                allocating a new one (used by render_overview so grid cells
+                are written once, without an intermediate buffer + paste)
+            offset: (x, y) translation to apply when drawing onto target
 
         Returns:
-            PIL.Image.Image — the rendered preview
+            PIL.Image.Image — the rendered preview. Implementations that
+            draw onto target should return target; returning a standalone
+            Image makes the caller fall back to resize + paste.
         """
         pass
 
@@ -114,69 +235,158 @@ class PreviewRenderer(ABC):
         pass
 
     # --- Overlay helpers (use these in your render_item implementation) ---
+    # Overlay colors carry alpha. Draw them onto a transparent "RGBA" layer
+    # and Image.alpha_composite it over your render in one pass — drawing
+    # them straight onto an RGB image silently drops the transparency.
 
-    @staticmethod
-    def draw_horizontal_line(draw, y, width, color, label=None):
+    def draw_horizontal_line(self, draw, y, width, color, label=None):
         """Draw a horizontal reference line with optional label."""
         draw.line([(0, y), (width, y)], fill=color, width=1)
         if label:
-            draw.text((4, y - 14), label, fill=color)
+            draw.text((4, y - 14), label, fill=color, font=self._font)
 
-    @staticmethod
-    def draw_vertical_line(draw, x, height, color, label=None):
+    def draw_vertical_line(self, draw, x, height, color, label=None):
         """Draw a vertical reference line with optional label."""
         draw.line([(x, 0), (x, height)], fill=color, width=1)
         if label:
-            draw.text((x + 4, 4), label, fill=color)
+            draw.text((x + 4, 4), label, fill=color, font=self._font)
 
     @staticmethod
-    def draw_grid(draw, width, height, spacing, color=(60, 60, 80, 80)):
-        """Draw a reference grid."""
+    def draw_grid(img, spacing, color=(60, 60, 80, 80)):
+        """Draw a reference grid across the whole image.
+
+        Takes the Image (not a draw context): with NumPy available the grid
+        rows and columns are stamped in two vectorized slice assignments
+        instead of one draw.line() call per grid line.
+
+        The image must be RGB or RGBA — the alpha-blended grid colors
+        don't exist in a palette image's color table, so convert() "P"
+        renders before drawing a grid on them.
+        """
+        if img.mode not in ("RGB", "RGBA"):
+            raise ValueError(
+                f"draw_grid needs an RGB or RGBA image, got {img.mode!r}; "
+                "convert() the render first"
+            )
+        width, height = img.size
+        if np is not None and img.mode == "RGB":
+            arr = np.array(img, dtype=np.uint8)
+            base = arr.copy()
+            rgb = np.array(color[:3], dtype=np.float32)
+            alpha = color[3] / 255.0 if len(color) > 3 else 1.0
+            for rows_cols in (np.s_[::spacing, :], np.s_[:, ::spacing]):
+                # Blend against the original pixels so row/column
+                # intersections get a single application of the alpha
+                arr[rows_cols] = (base[rows_cols] * (1.0 - alpha)
+                                  + rgb * alpha + 0.5).astype(np.uint8)
+            img.paste(Image.fromarray(arr))
+            return
+
+        # Fallback: draw the lines on a transparent layer and composite
+        # once, so the alpha in the grid color is honored exactly like in
+        # the NumPy path (drawing straight onto RGB would drop it).
+        layer = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(layer)
         for x in range(0, width, spacing):
             draw.line([(x, 0), (x, height)], fill=color, width=1)
         for y in range(0, height, spacing):
             draw.line([(0, y), (width, y)], fill=color, width=1)
+        img.paste(Image.alpha_composite(img.convert("RGBA"),
+                                        layer).convert(img.mode))
 
-    @staticmethod
-    def draw_bounding_box(draw, x, y, w, h, color, label=None):
+    def draw_bounding_box(self, draw, x, y, w, h, color, label=None):
         """Draw a bounding box around a region."""
         draw.rectangle([x, y, x + w, y + h], outline=color, width=1)
         if label:
-            draw.text((x, y - 14), label, fill=color)
+            draw.text((x, y - 14), label, fill=color, font=self._font)
 
-    @staticmethod
-    def draw_label(draw, x, y, text, color=LABEL_COLOR):
+    def draw_label(self, draw, x, y, text, color=LABEL_COLOR):
         """Draw a text label at the given position."""
-        draw.text((x, y), text, fill=color)
+        draw.text((x, y), text, fill=color, font=self._font)
 
     # --- Rendering pipeline ---
 
-    def render_items(self, item_names, size=DEFAULT_SIZE, overlays=True):
+    def render_items(self, item_names, size=DEFAULT_SIZE, overlays=True,
+                     png_level=PNG_COMPRESS_LEVEL, jobs=1):
         """Render specific items to individual PNGs.
 
         Args:
             item_names: list of item identifiers to render
             size: target image size in pixels
             overlays: whether to include reference markers
+            png_level: zlib compression level for PNG output (0-9)
+            jobs: number of parallel render workers (1 = serial)
+
+        Assumes self.output_dir exists — run() creates it once up front.
         """
-        os.makedirs(self.output_dir, exist_ok=True)
+        if jobs > 1 and len(item_names) > 1:
+            self._render_items_parallel(item_names, size, overlays, png_level, jobs)
+            return
+
+        # Bind hot lookups once — LOAD_FAST beats LOAD_ATTR in a tight loop
+        render_item = self.render_item
+        cache = self._cache
 
-        for name in item_names:
-            img = self.render_item(name, size, overlays)
+        # Sanitize filenames up front: one C-level translate pass per name,
+        # outside the render loop
+        paths = [os.path.join(self.output_dir,
+                              str(name).translate(_FILENAME_SAFE) + ".png")
+                 for name in item_names]
+
+        for name, path in zip(item_names, paths):
+            img = render_item(name, size, overlays)
             if img is None:
                 print(f"  Warning: render_item returned None for '{name}', skipping")
                 continue
 
-            # Sanitize filename
-            safe_name = str(name).replace("/", "_").replace("\\", "_")
-            path = os.path.join(self.output_dir, f"{safe_name}.png")
-            img.save(path)
+            if cache is not None:
+                cache[name] = img
+            _save_png(img, path, png_level)
             print(f"  {name} -> {path}")
 
-    def render_overview(self, size=GRID_CELL_SIZE, overlays=True):
+    def _render_items_parallel(self, item_names, size, overlays, png_level, jobs):
+        """Render items concurrently. Items are independent after
+        load_artifact(), so this uses a process pool when the renderer is
+        picklable, and falls back to a thread pool otherwise (PIL drawing
+        and zlib encoding both release the GIL, so threads still scale).
+        """
+        tasks = [(name, os.path.join(self.output_dir,
+                                     str(name).translate(_FILENAME_SAFE) + ".png"))
+                 for name in item_names]
+
+        # Ship the renderer to each worker once via the pool initializer —
+        # per-task pickling would re-serialize the loaded artifact for
+        # every item. The pickle doubles as the picklability probe.
+        try:
+            payload = pickle.dumps(self)
+            executor_cls = concurrent.futures.ProcessPoolExecutor
+        except Exception:
+            payload = self  # threads share memory; no pickling needed
+            executor_cls = concurrent.futures.ThreadPoolExecutor
+
+        # Workers render and encode; the main thread does the writes, so
+        # file I/O overlaps with the next item's encode.
+        with executor_cls(max_workers=jobs, initializer=_init_render_worker,
+                          initargs=(payload,)) as pool:
+            futures = [(name, path,
+                        pool.submit(_render_one, name, size, overlays,
+                                    png_level))
+                       for name, path in tasks]
+            for name, path, future in futures:
+                data = future.result()
+                if data is None:
+                    print(f"  Warning: render_item returned None for '{name}', skipping")
+                    continue
+                with open(path, "wb", buffering=0) as f:
+                    f.write(data)
+                print(f"  {name} -> {path}")
+
+    def render_overview(self, size=GRID_CELL_SIZE, overlays=True,
+                        png_level=PNG_COMPRESS_LEVEL):
         """Render all items in a grid overview.
 
         Override this method if you need a custom layout.
+        Assumes self.output_dir exists — run() creates it once up front.
         """
         items = self.get_items()
         if not items:
@@ -184,64 +394,121 @@ class PreviewRenderer(ABC):
             return
 
         n = len(items)
-        cols = min(math.ceil(math.sqrt(n * 1.5)), 16)  # wider than tall
-        rows = math.ceil(n / cols)
+        # ceil(sqrt(n * 1.5)) in pure integer math — wider than tall.
+        # cols is the smallest k with k*k >= 1.5*n, i.e. 2*k*k >= 3*n.
+        k = math.isqrt(n * 3 // 2)
+        cols = min(k + (2 * k * k < 3 * n), 16)
+        rows = (n + cols - 1) // cols
 
         cell = size + GRID_PADDING
         img_w = cols * cell + GRID_PADDING
         img_h = rows * cell + GRID_PADDING
 
         overview = Image.new("RGB", (img_w, img_h), GRID_BG)
-
-        for idx, name in enumerate(items):
-            col = idx % cols
-            row = idx // cols
-            x = GRID_PADDING + col * cell
-            y = GRID_PADDING + row * cell
-
-            item_img = self.render_item(name, size, overlays=False)
+        draw = ImageDraw.Draw(overview)
+
+        # Bind hot lookups once for the per-cell loop
+        render_item = self.render_item
+        paste = overview.paste
+        text = draw.text
+        font = self._font
+        cache = self._cache if self._cache is not None else {}
+
+        # Grid geometry, computed up front
+        cells = [(GRID_PADDING + (idx % cols) * cell,
+                  GRID_PADDING + (idx // cols) * cell,
+                  name)
+                 for idx, name in enumerate(items)]
+
+        for x, y, name in cells:
+            # Reuse an image rendered earlier this run when it's at least
+            # cell-sized — a downscale beats redoing the draw work.
+            item_img = cache.get(name)
+            if item_img is None or min(item_img.size) < size:
+                item_img = render_item(name, size, overlays=False,
+                                       target=overview, offset=(x, y))
             if item_img is None:
                 continue
 
-            # Resize if needed
-            if item_img.size != (size, size):
-                item_img = item_img.resize((size, size), Image.LANCZOS)
-
-            overview.paste(item_img, (x, y))
+            if item_img is not overview:
+                # Implementation ignored target — fall back to resize + paste.
+                if item_img.size != (size, size):
+                    item_img = _resize_cell(item_img, size)
+                paste(item_img, (x, y))
 
             # Label
-            draw = ImageDraw.Draw(overview)
-            draw.text((x + 2, y + 2), str(name), fill=LABEL_COLOR)
+            text((x + 2, y + 2), str(name), fill=LABEL_COLOR, font=font)
 
-        os.makedirs(self.output_dir, exist_ok=True)
         path = os.path.join(self.output_dir, OVERVIEW_FILENAME)
-        overview.save(path)
+        _save_png(overview, path, png_level)
         print(f"  Overview -> {path} ({overview.width}x{overview.height}px)")
 
     def run(self, items=None, size=DEFAULT_SIZE, overlays=True,
-            overview_only=False, no_overview=False):
+            overview_only=False, no_overview=False,
+            png_level=PNG_COMPRESS_LEVEL, jobs=1):
         """Main entry point. Handles the full render pipeline."""
         print("Loading artifact...")
         if not self.load_artifact():
             print("Error: Failed to load artifact")
             return False
 
+        os.makedirs(self.output_dir, exist_ok=True)
+
         if overview_only:
             print("Rendering overview...")
-            self.render_overview(overlays=overlays)
+            self.render_overview(overlays=overlays, png_level=png_level)
         else:
             target_items = items if items else self.get_items()
             print(f"Rendering {len(target_items)} item(s) at {size}px...")
-            self.render_items(target_items, size, overlays)
-
-            if not no_overview:
-                print("Rendering overview...")
-                self.render_overview(overlays=overlays)
+            if not no_overview and not overlays:
+                # Let the overview reuse the items rendered below (serial
+                # path only — parallel workers return encoded bytes).
+                # Overview cells are always overlay-free, so only renders
+                # done without overlays are safe to reuse.
+                self._cache = {}
+            try:
+                self.render_items(target_items, size, overlays,
+                                  png_level=png_level, jobs=jobs)
+
+                if not no_overview:
+                    print("Rendering overview...")
+                    self.render_overview(overlays=overlays, png_level=png_level)
+            finally:
+                self._cache = None
 
         print("Done.")
         return True
 
 
+# Renderer installed per worker by _init_render_worker
+_WORKER_RENDERER = None
+
+
+def _init_render_worker(payload):
+    """Executor initializer: install the renderer once per worker.
+
+    Process-pool workers receive the renderer as pickled bytes (so the
+    loaded artifact crosses the process boundary once, not once per item);
+    thread-pool workers share memory and get the instance itself.
+    """
+    global _WORKER_RENDERER
+    _WORKER_RENDERER = (pickle.loads(payload) if isinstance(payload, bytes)
+                        else payload)
+
+
+def _render_one(name, size, overlays, png_level):
+    """Worker for parallel rendering: render one item and encode it.
+
+    Module-level so ProcessPoolExecutor can pickle it; uses the per-worker
+    renderer installed by _init_render_worker. Returns the encoded PNG
+    bytes — the caller handles the file write.
+    """
+    img = _WORKER_RENDERER.render_item(name, size, overlays)
+    if img is None:
+        return None
+    return _encode_png(img, png_level)
+
+
 # ---------------------------------------------------------------------------
 # Example implementation — replace with your own
 # ---------------------------------------------------------------------------
@@ -256,27 +523,49 @@ class ExampleRenderer(PreviewRenderer):
     EXAMPLE_ITEMS = ["button", "header", "card", "input", "modal",
                      "sidebar", "footer", "nav", "badge", "tooltip"]
 
+    # Name -> position, built once. A list .index() scan per render_item
+    # call turns O(n^2) across a full run as the item count grows.
+    EXAMPLE_INDEX = {name: i for i, name in enumerate(EXAMPLE_ITEMS)}
+
     EXAMPLE_COLORS = [
         (180, 60, 60), (60, 140, 180), (60, 160, 80), (180, 140, 60),
         (140, 80, 180), (180, 100, 60), (80, 80, 160), (160, 60, 120),
         (60, 160, 160), (140, 140, 60),
     ]
 
+    # Every color these previews can use. Flat-color renders fit in a
+    # palette ("P") image — 1 byte/pixel instead of 3, and Pillow emits
+    # PNG-8, so there's 3x less data to allocate, draw over, and deflate.
+    PALETTE = [BG_COLOR, FG_COLOR, LABEL_COLOR] + EXAMPLE_COLORS + [
+        c[:3] for c in OVERLAY_COLORS.values()
+    ]
+
     def load_artifact(self):
         # In a real implementation, you'd load your font/HTML/SVG/etc. here
         print("  (Example mode — no real artifact to load)")
         return True
 
-    def render_item(self, item_name, size, overlays=True):
-        img = Image.new("RGB", (size, size), BG_COLOR)
+    def render_item(self, item_name, size, overlays=True, target=None,
+                    offset=(0, 0)):
+        if target is None:
+            img = Image.new("P", (size, size), 0)  # index 0 = BG_COLOR
+            img.putpalette([channel for rgb in self.PALETTE for channel in rgb])
+            ox = oy = 0
+        else:
+            # Draw straight into the caller's canvas (e.g. the overview grid)
+            # instead of allocating an intermediate buffer to paste.
+            img = target
+            ox, oy = offset
         draw = ImageDraw.Draw(img)
+        if target is not None:
+            draw.rectangle([ox, oy, ox + size - 1, oy + size - 1], fill=BG_COLOR)
 
         # Draw a placeholder shape
-        idx = self.EXAMPLE_ITEMS.index(item_name) if item_name in self.EXAMPLE_ITEMS else 0
+        idx = self.EXAMPLE_INDEX.get(item_name, 0)
         color = self.EXAMPLE_COLORS[idx % len(self.EXAMPLE_COLORS)]
         margin = size // 6
         draw.rounded_rectangle(
-            [margin, margin, size - margin, size - margin],
+            [ox + margin, oy + margin, ox + size - margin, oy + size - margin],
             radius=size // 12,
             fill=color,
             outline=FG_COLOR,
@@ -284,18 +573,26 @@ class ExampleRenderer(PreviewRenderer):
         )
 
         # Label
-        draw.text((margin + 8, margin + 8), item_name, fill=FG_COLOR)
-
-        # Reference overlays
-        if overlays:
+        draw.text((ox + margin + 8, oy + margin + 8), item_name,
+                  fill=FG_COLOR, font=self._font)
+
+        # Reference overlays (standalone renders only — the helpers draw in
+        # full-image coordinates). The overlay colors are semi-transparent,
+        # so draw them on a transparent layer and composite once; PNG-8
+        # can't carry the alpha, so this path ends up RGB.
+        if overlays and target is None:
+            overlay_layer = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+            overlay_draw = ImageDraw.Draw(overlay_layer)
             center = size // 2
-            self.draw_horizontal_line(draw, center, size,
+            self.draw_horizontal_line(overlay_draw, center, size,
                                       OVERLAY_COLORS["baseline"], "center")
-            self.draw_vertical_line(draw, center, size,
+            self.draw_vertical_line(overlay_draw, center, size,
                                     OVERLAY_COLORS["tertiary"], "center")
-            self.draw_bounding_box(draw, margin, margin,
+            self.draw_bounding_box(overlay_draw, margin, margin,
                                    size - 2 * margin, size - 2 * margin,
                                    OVERLAY_COLORS["primary"], "bounds")
+            img = Image.alpha_composite(img.convert("RGBA"),
+                                        overlay_layer).convert("RGB")
 
         return img
 
@@ -331,6 +628,12 @@ Examples:
                         help="Skip the overview grid")
     parser.add_argument("--no-overlays", action="store_true",
                         help="Skip reference overlay markers")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Parallel render workers (default: 1, serial)")
+    parser.add_argument("--png-level", type=int, default=PNG_COMPRESS_LEVEL,
+                        choices=range(10), metavar="0-9",
+                        help=f"PNG zlib compression level; higher = smaller files, "
+                             f"slower encode (default: {PNG_COMPRESS_LEVEL})")
     return parser
 
 
@@ -347,6 +650,8 @@ def main():
         overlays=not args.no_overlays,
         overview_only=args.overview_only,
         no_overview=args.no_overview,
+        png_level=args.png_level,
+        jobs=args.jobs,
     )
 
 